@@ -0,0 +1,212 @@
+"""
+Single-pass dataset profiler for the MovieLens CSV files.
+
+Streams each file once in chunks and records row counts, dtypes, null counts,
+min/max, cardinality, value histograms and a few sample rows in a small JSON
+sidecar next to the data, so pages can show them without scanning 20M rows.
+
+Usage:
+    python data_profile.py ml-20m
+"""
+import json
+import os
+import sys
+import tempfile
+from collections import Counter
+
+import pandas as pd
+
+PROFILE_FILENAME = "profile.json"
+DATASETS = {"movies": "movies.csv", "ratings": "ratings.csv", "tags": "tags.csv"}
+
+# Unix timestamp columns are histogrammed by year and sampled as readable dates
+TIMESTAMP_COLUMNS = {"timestamp"}
+# Pipe-separated columns are histogrammed per individual value
+MULTI_VALUE_COLUMNS = {"genres": "|"}
+
+CHUNK_SIZE = 1_000_000
+# Distinct values tracked exactly up to this many, then reported as a lower bound
+CARDINALITY_LIMIT = 1_000_000
+# Columns with more distinct values than this get no value histogram
+HISTOGRAM_MAX_VALUES = 50
+SAMPLE_ROWS = 5
+
+
+def _to_python(value):
+    return value.item() if hasattr(value, "item") else value
+
+
+class ColumnProfile:
+    """
+    Running statistics for one column, updated chunk by chunk.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.dtypes = []
+        self.nulls = 0
+        self.min = None
+        self.max = None
+        self._distinct = set()
+        self._histogram = Counter()
+
+    def update(self, series):
+        dtype = str(series.dtype)
+        if dtype not in self.dtypes:
+            self.dtypes.append(dtype)
+        self.nulls += int(series.isna().sum())
+        values = series.dropna()
+        if values.empty:
+            return
+
+        if pd.api.types.is_numeric_dtype(values):
+            chunk_min, chunk_max = _to_python(values.min()), _to_python(values.max())
+            self.min = chunk_min if self.min is None else min(self.min, chunk_min)
+            self.max = chunk_max if self.max is None else max(self.max, chunk_max)
+
+        if self._distinct is not None:
+            self._distinct.update(values.unique().tolist())
+            if len(self._distinct) > CARDINALITY_LIMIT:
+                self._distinct = None
+
+        if self._histogram is None:
+            return
+        if self.name in TIMESTAMP_COLUMNS:
+            counts = pd.to_datetime(values, unit="s").dt.year.value_counts()
+        elif self.name in MULTI_VALUE_COLUMNS:
+            counts = values.str.split(MULTI_VALUE_COLUMNS[self.name]).explode().value_counts()
+        else:
+            counts = values.value_counts()
+        self._histogram.update(dict(zip(counts.index.tolist(), counts.tolist())))
+        # Years and genre names stay small; only raw-value histograms can blow up
+        raw_values = self.name not in TIMESTAMP_COLUMNS and self.name not in MULTI_VALUE_COLUMNS
+        if raw_values and len(self._histogram) > HISTOGRAM_MAX_VALUES:
+            self._histogram = None
+
+    def to_dict(self):
+        return {
+            "dtype": " | ".join(self.dtypes),
+            "nulls": self.nulls,
+            "min": self.min,
+            "max": self.max,
+            "distinct": CARDINALITY_LIMIT if self._distinct is None else len(self._distinct),
+            "distinct_exact": self._distinct is not None,
+            "histogram": None if self._histogram is None else sorted([key, count] for key, count in self._histogram.items()),
+        }
+
+
+def _source_stat(path):
+    stat = os.stat(path)
+    return {"size": stat.st_size, "mtime": stat.st_mtime}
+
+
+def _profile_chunks(chunks, path):
+    rows = 0
+    columns = {}
+    sample = None
+    for chunk in chunks:
+        if sample is None:
+            sample = chunk.head(SAMPLE_ROWS).copy()
+            for column in TIMESTAMP_COLUMNS.intersection(sample.columns):
+                sample["date"] = pd.to_datetime(sample[column], unit="s").astype(str)
+        rows += len(chunk)
+        for column in chunk.columns:
+            if column not in columns:
+                columns[column] = ColumnProfile(column)
+            columns[column].update(chunk[column])
+
+    return {
+        "source": _source_stat(path),
+        "rows": rows,
+        "columns": {name: column.to_dict() for name, column in columns.items()},
+        "sample": [] if sample is None else json.loads(sample.to_json(orient="records")),
+    }
+
+
+def profile_csv(path, chunksize=CHUNK_SIZE):
+    """
+    Profile one CSV file in a single streaming pass.
+    """
+    return _profile_chunks(pd.read_csv(path, chunksize=chunksize), path)
+
+
+def profile_frame(df, path, chunksize=CHUNK_SIZE):
+    """
+    Profile a frame already read from path, in slices, without re-reading the file.
+    """
+    return _profile_chunks((df.iloc[start:start + chunksize] for start in range(0, max(len(df), 1), chunksize)), path)
+
+
+def build_profile(data_dir, chunksize=CHUNK_SIZE, frames=None):
+    """
+    Profile every dataset in data_dir and write the sidecar next to the data.
+
+    frames optionally maps dataset names to DataFrames that were just read
+    from their CSVs, so those files are not read a second time.
+    """
+    frames = frames or {}
+    profile = {}
+    for name, filename in DATASETS.items():
+        path = os.path.join(data_dir, filename)
+        profile[name] = profile_frame(frames[name], path, chunksize) if name in frames else profile_csv(path, chunksize)
+    sidecar = os.path.join(data_dir, PROFILE_FILENAME)
+    # Each writer gets its own temp file in the same directory, so concurrent
+    # builds never interleave and the rename leaves readers a complete file
+    tmp = tempfile.NamedTemporaryFile("w", dir=data_dir, prefix=PROFILE_FILENAME + ".", suffix=".tmp", delete=False)
+    try:
+        with tmp:
+            json.dump(profile, tmp, indent=1)
+        os.replace(tmp.name, sidecar)
+    except BaseException:
+        os.remove(tmp.name)
+        raise
+    return profile
+
+
+def is_stale(profile, data_dir):
+    for name, filename in DATASETS.items():
+        if name not in profile or profile[name]["source"] != _source_stat(os.path.join(data_dir, filename)):
+            return True
+    return False
+
+
+def load_profile(data_dir, frames=None):
+    """
+    Read the sidecar, rebuilding it first if missing or older than the data.
+    """
+    sidecar = os.path.join(data_dir, PROFILE_FILENAME)
+    try:
+        with open(sidecar) as f:
+            profile = json.load(f)
+    except (OSError, ValueError):
+        return build_profile(data_dir, frames=frames)
+    if is_stale(profile, data_dir):
+        return build_profile(data_dir, frames=frames)
+    return profile
+
+
+def column_table(dataset_profile):
+    """
+    One row per column with dtype, nulls, cardinality and range, for display.
+    """
+    table = pd.DataFrame.from_dict(dataset_profile["columns"], orient="index")
+    table["distinct"] = [
+        f"{row['distinct']:,}" if row["distinct_exact"] else f">{row['distinct']:,}"
+        for _, row in table.iterrows()
+    ]
+    return table[["dtype", "nulls", "distinct", "min", "max"]]
+
+
+def histogram_frame(column_profile):
+    """
+    A column's stored histogram as a count per value, or None if it has none.
+    """
+    if column_profile["histogram"] is None:
+        return None
+    return pd.DataFrame(column_profile["histogram"], columns=["value", "count"]).set_index("value")
+
+
+if __name__ == "__main__":
+    data_dir = sys.argv[1] if len(sys.argv) > 1 else "ml-20m"
+    for name, dataset_profile in build_profile(data_dir).items():
+        print(f"{name}: {dataset_profile['rows']:,} rows")
@@ -0,0 +1,233 @@
+"""
+Headless multi-session load test for the MovieLens dashboard.
+
+Drives N simulated analysts through every page of the app with Streamlit's
+AppTest, moving the support/confidence sliders and the genre selectbox, and
+reports rerun latency, per-session memory and process RSS.
+
+AppTest installs a process-wide runtime for each run, so reruns execute one
+at a time: the latency figures are serial, single-session numbers with no
+contention between sessions and are not valid for capacity planning. Only
+the memory figures reflect N sessions holding their state at once.
+
+Usage:
+    python load_test.py --sessions 10 --rounds 3
+"""
+import argparse
+import json
+import math
+import random
+import sys
+import time
+
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+from views import PAGE_TITLES as PAGES
+
+MENU_KEY = "main_menu"
+SUPPORT_VALUES = [round(0.001 * i, 3) for i in range(1, 11)]
+CONFIDENCE_VALUES = [round(0.1 + 0.05 * i, 2) for i in range(19)]
+MINING_PENDING_TEXT = "Showing the previous results until the new run finishes."
+
+
+def current_rss_bytes():
+    """
+    Resident set size of this process, or None if no source is available.
+
+    Reads /proc on Linux, then psutil if installed, then falls back to the
+    peak reported by getrusage.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return peak_rss_bytes()
+    return psutil.Process().memory_info().rss
+
+
+def peak_rss_bytes():
+    """
+    Peak resident set size from getrusage, or None where resource is missing.
+    """
+    try:
+        # POSIX only; on Windows the peak comes from the sampled RSS instead
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _max_known(*values):
+    known = [value for value in values if value is not None]
+    return max(known) if known else None
+
+
+def deep_size(value):
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(deep_size(k) + deep_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(deep_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+def session_state_bytes(at):
+    return sum(deep_size(key) + deep_size(at.session_state[key]) for key in at.session_state)
+
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile of a non-empty list.
+    """
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class SimulatedSession:
+    """
+    One analyst walking through the dashboard pages.
+    """
+
+    def __init__(self, app_path, timeout, mining_timeout, rng):
+        self.at = AppTest.from_file(app_path, default_timeout=timeout)
+        self.mining_timeout = mining_timeout
+        self.rng = rng
+        self.latencies = []
+        self.mining_latencies = []
+
+    def _rerun(self, action):
+        start = time.perf_counter()
+        action()
+        self.latencies.append(time.perf_counter() - start)
+        if self.at.exception:
+            raise RuntimeError(f"App raised during load test: {self.at.exception[0].message}")
+
+    def _wait_for_mining(self):
+        # The progress fragment cannot poll under AppTest, so rerun until the job lands
+        start = time.perf_counter()
+        while any(info.value == MINING_PENDING_TEXT for info in self.at.info):
+            if time.perf_counter() - start > self.mining_timeout:
+                raise TimeoutError("Mining job did not finish within the mining timeout.")
+            time.sleep(0.2)
+            self._rerun(self.at.run)
+        self.mining_latencies.append(time.perf_counter() - start)
+
+    def visit(self, page):
+        self.at.session_state[MENU_KEY] = page
+        self._rerun(self.at.run)
+
+        if page == "Association Rule Mining":
+            self._wait_for_mining()
+            support = self.rng.choice(SUPPORT_VALUES)
+            self._rerun(self.at.slider(key="support_slider_assoc").set_value(support).run)
+            self._wait_for_mining()
+            confidence = self.rng.choice(CONFIDENCE_VALUES)
+            self._rerun(self.at.slider(key="confidence_slider_assoc").set_value(confidence).run)
+            self._wait_for_mining()
+        elif page == "Recommendations" and self.at.selectbox:
+            genre = self.rng.choice(self.at.selectbox[0].options)
+            self._rerun(self.at.selectbox[0].select(genre).run)
+
+
+def run_load_test(app_path, sessions, rounds, timeout, mining_timeout, seed):
+    rng = random.Random(seed)
+    peak_rss = current_rss_bytes()
+
+    # Warm the shared data caches and mining executor first, so the baseline
+    # already includes one-time costs and only per-session growth is divided
+    warmup = SimulatedSession(app_path, timeout, mining_timeout, random.Random(rng.random()))
+    for page in PAGES:
+        warmup.visit(page)
+        peak_rss = _max_known(peak_rss, current_rss_bytes())
+    baseline_rss = current_rss_bytes()
+
+    simulated = [SimulatedSession(app_path, timeout, mining_timeout, random.Random(rng.random())) for _ in range(sessions)]
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        # Interleave sessions page by page so every session holds its state at
+        # once; reruns still run one at a time (see the module docstring)
+        for page in PAGES:
+            for session in simulated:
+                session.visit(page)
+                peak_rss = _max_known(peak_rss, current_rss_bytes())
+    elapsed = time.perf_counter() - start
+
+    latencies = [latency for session in simulated for latency in session.latencies]
+    mining_latencies = [latency for session in simulated for latency in session.mining_latencies]
+    session_bytes = [session_state_bytes(session.at) for session in simulated]
+    final_rss = current_rss_bytes()
+
+    return {
+        "sessions": sessions,
+        "rounds": rounds,
+        "reruns": len(latencies),
+        "elapsed_s": elapsed,
+        "latency_mode": "serial",
+        "serial_rerun_p50_s": percentile(latencies, 50),
+        "serial_rerun_p95_s": percentile(latencies, 95),
+        "serial_rerun_max_s": max(latencies),
+        "mining_p50_s": percentile(mining_latencies, 50) if mining_latencies else None,
+        "mining_p95_s": percentile(mining_latencies, 95) if mining_latencies else None,
+        "session_state_mean_bytes": sum(session_bytes) / len(session_bytes),
+        "session_state_max_bytes": max(session_bytes),
+        "rss_per_session_bytes": None if final_rss is None or baseline_rss is None else (final_rss - baseline_rss) / sessions,
+        "baseline_rss_bytes": baseline_rss,
+        "final_rss_bytes": final_rss,
+        "peak_rss_bytes": _max_known(peak_rss, peak_rss_bytes()),
+    }
+
+
+def _format_mb(value, digits):
+    return "n/a" if value is None else f"{value / (1024 * 1024):.{digits}f} MB"
+
+
+def format_report(report):
+    lines = [
+        f"Sessions: {report['sessions']}  Rounds: {report['rounds']}  Reruns: {report['reruns']:,}  Elapsed: {report['elapsed_s']:.1f}s",
+        f"Serial rerun latency  p50: {report['serial_rerun_p50_s'] * 1000:.0f} ms  p95: {report['serial_rerun_p95_s'] * 1000:.0f} ms  max: {report['serial_rerun_max_s'] * 1000:.0f} ms",
+    ]
+    if report["mining_p50_s"] is not None:
+        lines.append(f"Mining wait           p50: {report['mining_p50_s'] * 1000:.0f} ms  p95: {report['mining_p95_s'] * 1000:.0f} ms")
+    lines += [
+        "  Reruns ran one at a time, so these are single-session figures without",
+        "  contention between sessions; do not use them for capacity planning.",
+        f"Session state   mean: {_format_mb(report['session_state_mean_bytes'], 2)}  max: {_format_mb(report['session_state_max_bytes'], 2)}",
+        f"RSS per session (growth after warm-up / sessions): {_format_mb(report['rss_per_session_bytes'], 2)}",
+        f"Process RSS     warm baseline: {_format_mb(report['baseline_rss_bytes'], 0)}  final: {_format_mb(report['final_rss_bytes'], 0)}  peak: {_format_mb(report['peak_rss_bytes'], 0)}",
+    ]
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive simulated sessions through the dashboard and report serial rerun latency and memory.")
+    parser.add_argument("--app", default="app.py", help="Path to the Streamlit script.")
+    parser.add_argument("--sessions", type=int, default=5, help="Number of simulated sessions.")
+    parser.add_argument("--rounds", type=int, default=1, help="Walks through all pages per session.")
+    parser.add_argument("--timeout", type=float, default=600, help="Per-rerun timeout in seconds.")
+    parser.add_argument("--mining-timeout", type=float, default=600, help="Seconds to wait for a mining job.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for slider and genre choices.")
+    parser.add_argument("--json", help="Also write the report to this JSON file.")
+    args = parser.parse_args()
+
+    report = run_load_test(args.app, args.sessions, args.rounds, args.timeout, args.mining_timeout, args.seed)
+    print(format_report(report))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from mlxtend.frequent_patterns import apriori, association_rules
+
+# --------------------------
+# Background Mining Jobs
+# --------------------------
+
+# Maximum number of Apriori / rule-generation jobs running at once for the
+# whole server process, shared by every session. Each session holds at most
+# one of these slots at a time.
+MAX_CONCURRENT_JOBS = 2
+
+# Number of finished jobs (and frequent itemset results) kept around so that
+# revisiting a slider position is served instantly.
+MAX_CACHED_RESULTS = 32
+
+
+class JobCancelled(Exception):
+    """
+    Raised inside a worker when its job was superseded before finishing.
+    """
+
+
+class MiningJob:
+    """
+    A single Apriori + association rules run for one (support, confidence) pair.
+    """
+
+    def __init__(self, key, min_support, min_confidence, dataset_key, onehot):
+        self.key = key
+        self.min_support = min_support
+        self.min_confidence = min_confidence
+        self.dataset_key = dataset_key
+        self.onehot = onehot
+        self.owner = None
+        self.status = "queued"
+        self.progress = 0.0
+        self.message = "Waiting for a free worker..."
+        self.frequent_itemsets = None
+        self.rules = None
+        self.error = None
+        self.future = None
+        self.subscribers = set()
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancel_requested(self):
+        return self._cancel_event.is_set()
+
+    @property
+    def done(self):
+        return self.status in ("finished", "failed", "cancelled")
+
+    def cancel(self):
+        self._cancel_event.set()
+        # A job that was never handed to the pool can be dropped outright
+        if self.future is None or self.future.cancel():
+            self.status = "cancelled"
+            self.message = "Cancelled."
+
+    def _update(self, status, progress, message):
+        if self._cancel_event.is_set():
+            raise JobCancelled()
+        self.status = status
+        self.progress = progress
+        self.message = message
+
+
+class MiningExecutor:
+    """
+    Runs mining jobs on a bounded thread pool.
+
+    Identical requests are deduplicated across sessions, and a session that
+    moves a slider releases its previous job, which is cancelled once no other
+    session is waiting on it.
+
+    Each session owns at most one job on the pool, queued or running. A new
+    job from a session whose previous run is still occupying a worker (an
+    Apriori call cannot be interrupted) is held back until that run exits,
+    so one session dragging a slider can never take more than one worker
+    or queue ahead of other sessions more than once.
+    """
+
+    def __init__(self, max_workers=MAX_CONCURRENT_JOBS, max_cached=MAX_CACHED_RESULTS):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mining")
+        self._lock = threading.Lock()
+        self._max_cached = max_cached
+        self._jobs = OrderedDict()
+        self._itemsets = OrderedDict()
+        self._session_jobs = {}
+        # Per session: the job it has on the pool, and the next one held back
+        self._running = {}
+        self._held = {}
+
+    def submit(self, session_id, dataset_key, onehot, min_support, min_confidence, retry=False):
+        """
+        Return the job for the given thresholds, starting one if needed.
+
+        A failed job is returned as-is so callers can show its error; pass
+        retry=True to replace it with a fresh run.
+        """
+        min_support = round(float(min_support), 6)
+        min_confidence = round(float(min_confidence), 6)
+        key = (dataset_key, min_support, min_confidence)
+
+        with self._lock:
+            previous_key = self._session_jobs.get(session_id)
+            if previous_key is not None and previous_key != key:
+                self._release(session_id, previous_key)
+
+            job = self._jobs.get(key)
+            if job is None or job.status == "cancelled" or job.cancel_requested or (retry and job.status == "failed"):
+                job = MiningJob(key, min_support, min_confidence, dataset_key, onehot)
+                self._jobs[key] = job
+                self._dispatch(job, session_id)
+            self._jobs.move_to_end(key)
+
+            job.subscribers.add(session_id)
+            self._session_jobs[session_id] = key
+            self._evict()
+            return job
+
+    def _release(self, session_id, key):
+        job = self._jobs.get(key)
+        if job is None:
+            return
+        job.subscribers.discard(session_id)
+        if not job.subscribers and not job.done:
+            job.cancel()
+            if job.status == "cancelled":
+                del self._jobs[key]
+                self._job_exited(job)
+        elif job.subscribers and self._held.get(session_id) is job:
+            # Other sessions still want this held job, so hand it to one of them
+            del self._held[session_id]
+            self._dispatch(job, next(iter(job.subscribers)))
+
+    def _dispatch(self, job, owner):
+        job.owner = owner
+        if owner in self._running:
+            previous = self._held.pop(owner, None)
+            if previous is not None and previous is not job:
+                previous.cancel()
+                if self._jobs.get(previous.key) is previous:
+                    del self._jobs[previous.key]
+            self._held[owner] = job
+            job.message = "Waiting for your previous run to stop..."
+        else:
+            self._start(job)
+
+    def _start(self, job):
+        job.message = "Waiting for a free worker..."
+        self._running[job.owner] = job
+        job.future = self._pool.submit(self._run, job)
+
+    def _job_exited(self, job):
+        # Frees the owner's pool slot and starts the job it was holding back
+        if self._running.get(job.owner) is job:
+            del self._running[job.owner]
+            held = self._held.pop(job.owner, None)
+            if held is not None:
+                self._start(held)
+        elif self._held.get(job.owner) is job:
+            del self._held[job.owner]
+
+    def _evict(self):
+        # Only finished jobs are dropped; running ones are still referenced.
+        while len(self._jobs) > self._max_cached:
+            for key, job in self._jobs.items():
+                if job.done:
+                    del self._jobs[key]
+                    break
+            else:
+                break
+        while len(self._itemsets) > self._max_cached:
+            self._itemsets.popitem(last=False)
+
+    def _run(self, job):
+        onehot = job.onehot
+        try:
+            itemsets_key = (job.dataset_key, job.min_support)
+            with self._lock:
+                frequent_itemsets = self._itemsets.get(itemsets_key)
+
+            if frequent_itemsets is None:
+                job._update("running", 0.1, "Running Apriori algorithm...")
+                frequent_itemsets = apriori(onehot, min_support=job.min_support, use_colnames=True)
+                with self._lock:
+                    self._itemsets[itemsets_key] = frequent_itemsets
+                    self._evict()
+            job.frequent_itemsets = frequent_itemsets
+
+            job._update("running", 0.7, "Generating association rules...")
+            if frequent_itemsets.empty:
+                rules = None
+            else:
+                # Calculate num_itemsets as the number of transactions
+                rules = association_rules(frequent_itemsets, num_itemsets=onehot.shape[0], metric="confidence", min_threshold=job.min_confidence)
+
+            job._update("running", 1.0, "Done.")
+            job.rules = rules
+            job.status = "finished"
+        except JobCancelled:
+            job.status = "cancelled"
+            job.message = "Cancelled."
+        except Exception as e:
+            job.error = e
+            job.status = "failed"
+            job.message = f"Error: {e}"
+        finally:
+            job.onehot = None
+            with self._lock:
+                self._job_exited(job)
@@ -0,0 +1,380 @@
+"""
+Sequential pattern mining over users' time-ordered rating histories.
+
+Each user's ratings are turned into a sequence of events (one event per rated
+movie, ordered by timestamp) and stored compactly as offset/value arrays. At
+the genre level an event holds every genre of the rated movie. A PrefixSpan
+miner with pseudo-projection then finds patterns such as
+"Drama → Comedy → Thriller": each element comes from a strictly later event
+than the one before it.
+
+Usage:
+    python sequence_mining.py ml-20m --level genre --min-support 0.5
+"""
+import argparse
+import json
+import math
+import os
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+import pandas as pd
+
+CHUNK_SIZE = 1_000_000
+# Rough bytes of temporary arrays needed per expanded suffix position
+BYTES_PER_POSITION = 64
+NO_GENRES = "(no genres listed)"
+
+
+def _ragged_arange(counts):
+    """
+    Concatenation of arange(c) for every c in counts.
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    return np.arange(counts.sum(), dtype=np.int64) - np.repeat(np.cumsum(counts) - counts, counts)
+
+
+class SequenceDatabase:
+    """
+    Sequences stored as CSR arrays.
+
+    Sequence i spans values[offsets[i]:offsets[i + 1]]. When an event holds
+    several items, event_end[p] is the position just past the event that
+    contains p; without it every position is its own event.
+    """
+
+    def __init__(self, offsets, values, labels, event_end=None, path=None):
+        self.offsets = offsets
+        self.values = values
+        self.labels = labels
+        self.event_end = event_end
+        self.path = path
+
+    @property
+    def n_sequences(self):
+        return len(self.offsets) - 1
+
+    @property
+    def item_space(self):
+        return len(self.labels)
+
+    def next_start(self, positions):
+        return positions + 1 if self.event_end is None else self.event_end[positions].astype(np.int64)
+
+    def decode(self, items):
+        return tuple(self.labels[item] for item in items)
+
+    def save(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, "offsets.npy"), self.offsets)
+        np.save(os.path.join(directory, "values.npy"), self.values)
+        if self.event_end is not None:
+            np.save(os.path.join(directory, "event_end.npy"), self.event_end)
+        with open(os.path.join(directory, "labels.json"), "w") as f:
+            json.dump(self.labels, f)
+        self.path = directory
+
+    @classmethod
+    def load(cls, directory, mmap_mode="r"):
+        """
+        Load saved arrays, memory-mapped by default so worker processes share pages.
+        """
+        offsets = np.load(os.path.join(directory, "offsets.npy"), mmap_mode=mmap_mode)
+        values = np.load(os.path.join(directory, "values.npy"), mmap_mode=mmap_mode)
+        event_end_path = os.path.join(directory, "event_end.npy")
+        event_end = np.load(event_end_path, mmap_mode=mmap_mode) if os.path.exists(event_end_path) else None
+        with open(os.path.join(directory, "labels.json")) as f:
+            labels = json.load(f)
+        return cls(offsets, values, labels, event_end, path=directory)
+
+
+def _genre_index(movies_path):
+    """
+    Map movieId to its genre indices as CSR arrays.
+    """
+    movies = pd.read_csv(movies_path, usecols=["movieId", "genres"])
+    genres = movies["genres"].str.split("|")
+    labels = sorted({genre for movie_genres in genres for genre in movie_genres if genre != NO_GENRES})
+    label_index = {genre: i for i, genre in enumerate(labels)}
+
+    movie_position = np.full(movies["movieId"].max() + 1, -1, dtype=np.int64)
+    movie_position[movies["movieId"].to_numpy()] = np.arange(len(movies))
+    encoded = [[label_index[genre] for genre in movie_genres if genre != NO_GENRES] for movie_genres in genres]
+    counts = np.array([len(movie_genres) for movie_genres in encoded], dtype=np.int64)
+    genre_offsets = np.concatenate([[0], np.cumsum(counts)])
+    genre_values = np.array([genre for movie_genres in encoded for genre in movie_genres], dtype=np.uint8)
+    return labels, movie_position, genre_offsets, genre_values
+
+
+def build_sequences(ratings_path, movies_path, level="genre", min_rating=None, chunksize=CHUNK_SIZE):
+    """
+    Stream ratings.csv once into a SequenceDatabase of per-user timelines.
+
+    level is "movie" (one item per rating) or "genre" (the rated movie's
+    genres form one event). min_rating keeps only ratings at or above it.
+    """
+    if level not in ("movie", "genre"):
+        raise ValueError(f"Unknown sequence level: {level}")
+
+    if level == "genre":
+        labels, movie_position, genre_offsets, genre_values = _genre_index(movies_path)
+    else:
+        titles = pd.read_csv(movies_path, usecols=["movieId", "title"])
+        labels = [""] * (titles["movieId"].max() + 1)
+        for movie_id, title in zip(titles["movieId"], titles["title"]):
+            labels[movie_id] = title
+
+    lengths, values, event_end = [], [], []
+    total = 0
+    reader = pd.read_csv(
+        ratings_path,
+        usecols=["userId", "movieId", "rating", "timestamp"],
+        dtype={"userId": np.int32, "movieId": np.int32, "rating": np.float32, "timestamp": np.int64},
+        chunksize=chunksize,
+    )
+    for chunk in _complete_users(reader):
+        if min_rating is not None:
+            chunk = chunk[chunk["rating"] >= min_rating]
+        users = chunk["userId"].to_numpy()
+        movie_ids = chunk["movieId"].to_numpy()
+        order = np.lexsort((movie_ids, chunk["timestamp"].to_numpy(), users))
+        users, movie_ids = users[order], movie_ids[order]
+
+        if level == "genre":
+            movies = movie_position[movie_ids]
+            counts = genre_offsets[movies + 1] - genre_offsets[movies]
+            chunk_values = genre_values[np.repeat(genre_offsets[movies], counts) + _ragged_arange(counts)]
+            # Every genre of a rating ends where that rating's genre block ends
+            chunk_event_end = np.repeat(total + np.cumsum(counts), counts)
+            event_end.append(chunk_event_end.astype(np.int32))
+        else:
+            counts = np.ones(len(movie_ids), dtype=np.int64)
+            chunk_values = movie_ids
+
+        # Users are contiguous after sorting, so per-user lengths are run lengths
+        boundaries = np.flatnonzero(np.diff(users)) + 1
+        per_user = np.add.reduceat(counts, np.concatenate([[0], boundaries])) if len(users) else np.array([], dtype=np.int64)
+        lengths.append(per_user)
+        values.append(chunk_values)
+        total += len(chunk_values)
+
+    if total >= np.iinfo(np.int32).max:
+        raise ValueError("Too many sequence positions for 32-bit event offsets.")
+
+    lengths = np.concatenate(lengths) if lengths else np.array([], dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+    value_dtype = np.uint8 if level == "genre" else np.int32
+    values = np.concatenate(values).astype(value_dtype) if values else np.array([], dtype=value_dtype)
+    event_end = (np.concatenate(event_end) if event_end else np.array([], dtype=np.int32)) if level == "genre" else None
+    return SequenceDatabase(offsets, values, labels, event_end)
+
+
+def _complete_users(reader):
+    """
+    Re-chunk a userId-sorted CSV reader so no user is split across chunks.
+    """
+    carry = None
+    for chunk in reader:
+        if carry is not None:
+            chunk = pd.concat([carry, chunk], ignore_index=True)
+        last_user = chunk["userId"].iloc[-1]
+        split = chunk["userId"].to_numpy() == last_user
+        carry = chunk[split]
+        if not split.all():
+            yield chunk[~split]
+    if carry is not None and not carry.empty:
+        yield carry
+
+
+def _expand(db, seq_ids, starts, max_positions):
+    """
+    Yield (owner, positions) batches covering every suffix, at most
+    max_positions positions per batch (but always at least one sequence).
+    """
+    lengths = db.offsets[seq_ids + 1] - starts
+    cumulative = np.cumsum(lengths)
+    begin = 0
+    while begin < len(seq_ids):
+        limit = (cumulative[begin - 1] if begin else 0) + max_positions
+        stop = max(begin + 1, int(np.searchsorted(cumulative, limit, side="right")))
+        batch_lengths = lengths[begin:stop]
+        owner = np.repeat(np.arange(begin, stop, dtype=np.int64), batch_lengths)
+        positions = np.repeat(starts[begin:stop], batch_lengths) + _ragged_arange(batch_lengths)
+        yield owner, positions
+        begin = stop
+
+
+def _first_occurrences(db, seq_ids, starts, max_positions):
+    """
+    Yield, batch by batch, every (owner, item, first position) triple of the
+    projected suffixes, where owner indexes into seq_ids.
+    """
+    for owner, positions in _expand(db, seq_ids, starts, max_positions):
+        keys = owner * db.item_space + db.values[positions].astype(np.int64)
+        # Positions are ordered within each owner, so the first index is the earliest occurrence
+        unique_keys, first = np.unique(keys, return_index=True)
+        yield unique_keys // db.item_space, unique_keys % db.item_space, positions[first]
+
+
+def _item_groups(items, support, max_positions):
+    """
+    Split items into consecutive groups whose total support fits max_positions
+    (a single item larger than that forms its own group).
+    """
+    group, size = [], 0
+    for item in items:
+        if group and size + support[item] > max_positions:
+            yield np.array(group, dtype=np.int64)
+            group, size = [], 0
+        group.append(item)
+        size += support[item]
+    if group:
+        yield np.array(group, dtype=np.int64)
+
+
+def _grow(db, seq_ids, starts, min_count, max_positions):
+    """
+    Lazily yield the frequent one-item extensions of a projected database,
+    with their supports and child projections, most frequent first.
+
+    Supports are counted batch by batch. Child projections are then built for
+    groups of items whose matches fit max_positions, re-expanding the suffixes
+    once per group, so no step holds more than about max_positions entries.
+    """
+    support = np.zeros(db.item_space, dtype=np.int64)
+    for _, items, _ in _first_occurrences(db, seq_ids, starts, max_positions):
+        support += np.bincount(items, minlength=db.item_space)
+    frequent = np.flatnonzero(support >= min_count)
+    frequent = frequent[np.argsort(-support[frequent], kind="stable")]
+
+    for group in _item_groups(frequent, support, max_positions):
+        in_group = np.zeros(db.item_space, dtype=bool)
+        in_group[group] = True
+        owners, items, firsts = [], [], []
+        for batch_owners, batch_items, batch_firsts in _first_occurrences(db, seq_ids, starts, max_positions):
+            keep = in_group[batch_items]
+            owners.append(batch_owners[keep])
+            items.append(batch_items[keep])
+            firsts.append(batch_firsts[keep])
+        owners, items, firsts = np.concatenate(owners), np.concatenate(items), np.concatenate(firsts)
+
+        order = np.argsort(items, kind="stable")
+        owners, items, firsts = owners[order], items[order], firsts[order]
+        boundaries = np.flatnonzero(np.diff(items)) + 1
+        children = {}
+        for item_owners, item_firsts, item in zip(np.split(owners, boundaries), np.split(firsts, boundaries), items[np.concatenate([[0], boundaries])]):
+            children[int(item)] = (item_owners, item_firsts)
+        del owners, items, firsts
+
+        for item in group.tolist():
+            item_owners, item_firsts = children.pop(item)
+            child_seq_ids = seq_ids[item_owners]
+            child_starts = db.next_start(item_firsts)
+            # Sequences with nothing left after the match cannot support longer patterns
+            alive = child_starts < db.offsets[child_seq_ids + 1]
+            yield item, len(item_owners), child_seq_ids[alive], child_starts[alive]
+
+
+def _mine_prefix(db, prefix, seq_ids, starts, min_count, max_length, max_positions, patterns):
+    if len(prefix) >= max_length or len(seq_ids) < min_count:
+        return
+    for item, support, child_seq_ids, child_starts in _grow(db, seq_ids, starts, min_count, max_positions):
+        pattern = prefix + (item,)
+        patterns.append((pattern, support))
+        _mine_prefix(db, pattern, child_seq_ids, child_starts, min_count, max_length, max_positions, patterns)
+
+
+def _mine_subtree(db, item, support, seq_ids, starts, min_count, max_length, max_positions):
+    """
+    Mine every pattern starting with item, from its projection computed by the parent.
+    """
+    patterns = [((item,), support)]
+    _mine_prefix(db, (item,), seq_ids, starts, min_count, max_length, max_positions, patterns)
+    return patterns
+
+
+_WORKER = {}
+
+
+def _init_worker(path, min_count, max_length, max_positions):
+    _WORKER["db"] = SequenceDatabase.load(path)
+    _WORKER["args"] = (min_count, max_length, max_positions)
+
+
+def _mine_subtree_in_worker(item, support, seq_ids, starts):
+    return _mine_subtree(_WORKER["db"], item, support, seq_ids, starts, *_WORKER["args"])
+
+
+def mine_sequential_patterns(db, min_support=0.5, max_length=3, processes=None, memory_budget_mb=256):
+    """
+    PrefixSpan over a SequenceDatabase.
+
+    min_support is the fraction of sequences that must contain a pattern.
+    The root projection of each frequent first item is computed once here
+    and mined as its own task on a process pool (processes=1 mines
+    in-process). memory_budget_mb caps the temporary arrays of each
+    projection step; depth-first search keeps at most one step per pattern
+    level alive, so a process peaks at roughly max_length times the budget
+    on top of the memory-mapped sequences.
+    """
+    min_count = max(1, math.ceil(min_support * db.n_sequences))
+    max_positions = max(1, memory_budget_mb * 1024 * 1024 // BYTES_PER_POSITION)
+
+    all_sequences = np.arange(db.n_sequences, dtype=np.int64)
+    # Roots come most frequent first, so the largest subtrees start early
+    roots = _grow(db, all_sequences, db.offsets[:-1].astype(np.int64), min_count, max_positions)
+
+    patterns = []
+    if processes == 1:
+        for item, support, seq_ids, starts in roots:
+            patterns.extend(_mine_subtree(db, item, support, seq_ids, starts, min_count, max_length, max_positions))
+    else:
+        workers = processes or os.cpu_count() or 1
+        with tempfile.TemporaryDirectory() as scratch:
+            # Workers memory-map the arrays instead of each receiving a pickled copy
+            path = db.path
+            if path is None:
+                SequenceDatabase(db.offsets, db.values, db.labels, db.event_end).save(scratch)
+                path = scratch
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(path, min_count, max_length, max_positions)) as executor:
+                # Keep only a few root projections in flight so they never pile up in memory
+                pending = set()
+                for root in roots:
+                    pending.add(executor.submit(_mine_subtree_in_worker, *root))
+                    if len(pending) >= 2 * workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            patterns.extend(future.result())
+                for future in pending:
+                    patterns.extend(future.result())
+
+    result = pd.DataFrame(
+        [(" → ".join(db.decode(pattern)), len(pattern), count, count / db.n_sequences) for pattern, count in patterns],
+        columns=["sequence", "length", "support_count", "support"],
+    )
+    return result.sort_values(["support", "length"], ascending=[False, True], ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mine sequential patterns from MovieLens rating timelines.")
+    parser.add_argument("data_dir", nargs="?", default="ml-20m", help="Directory containing ratings.csv and movies.csv.")
+    parser.add_argument("--level", choices=["genre", "movie"], default="genre", help="Sequence items: genres or movies.")
+    parser.add_argument("--min-rating", type=float, help="Only keep ratings at or above this value.")
+    parser.add_argument("--min-support", type=float, default=0.5, help="Fraction of users that must follow a pattern.")
+    parser.add_argument("--max-length", type=int, default=3, help="Longest pattern to mine.")
+    parser.add_argument("--processes", type=int, help="Worker processes (default: one per CPU).")
+    parser.add_argument("--memory-budget-mb", type=int, default=256, help="Temporary memory per projection step; a process peaks near max-length times this.")
+    parser.add_argument("--output", help="CSV file for the patterns (default: <data_dir>/sequential_patterns_<level>.csv).")
+    args = parser.parse_args()
+
+    db = build_sequences(os.path.join(args.data_dir, "ratings.csv"), os.path.join(args.data_dir, "movies.csv"), level=args.level, min_rating=args.min_rating)
+    print(f"Built {db.n_sequences:,} sequences with {len(db.values):,} items.")
+    patterns = mine_sequential_patterns(db, args.min_support, args.max_length, args.processes, args.memory_budget_mb)
+    output = args.output or os.path.join(args.data_dir, f"sequential_patterns_{args.level}.csv")
+    patterns.to_csv(output, index=False)
+    print(f"Wrote {len(patterns):,} patterns to {output}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Page registry for the dashboard.
+
+Each page in the option menu lives in its own module with a render()
+function. A module, and with it any heavy dependency it imports, is only
+loaded the first time its page is shown.
+"""
+import importlib
+import sys
+import time
+
+# Page title, option_menu icon and module name, in menu order
+PAGES = [
+    ("Welcome", "house", "welcome"),
+    ("Data Overview", "bar-chart-line", "data_overview"),
+    ("Data Preprocessing", "wrench", "data_preprocessing"),
+    ("Exploratory Analysis", "search", "exploratory_analysis"),
+    ("Association Rule Mining", "pie-chart", "association_rule_mining"),
+    ("Recommendations", "star", "recommendations"),
+]
+PAGE_TITLES = [title for title, _, _ in PAGES]
+PAGE_ICONS = [icon for _, icon, _ in PAGES]
+PAGE_MODULES = {title: f"{__name__}.{module}" for title, _, module in PAGES}
+
+# Seconds spent importing each page module the first time it was shown
+import_timings = {}
+
+
+def load_page(title):
+    """
+    Import the module for a page, timing the import on first use.
+    """
+    module_name = PAGE_MODULES[title]
+    if module_name not in sys.modules:
+        start = time.perf_counter()
+        importlib.import_module(module_name)
+        import_timings[title] = time.perf_counter() - start
+    return sys.modules[module_name]
+
+
+def render_page(title):
+    load_page(title).render()
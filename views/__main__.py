@@ -0,0 +1,52 @@
+"""
+Report the cold import cost of the app shell and of each page module.
+
+Every measurement runs in a fresh interpreter so nothing is already cached.
+
+Usage:
+    python -m views
+"""
+import json
+import os
+import subprocess
+import sys
+
+from views import PAGES
+
+HEAVY_MODULES = ["mlxtend", "seaborn", "plotly.express", "scipy", "requests", "streamlit_lottie"]
+
+# Imports what app.py needs before any page, then times the target module
+MEASURE_SCRIPT = """
+import importlib, json, sys, time
+start = time.perf_counter()
+import streamlit, pandas, streamlit_option_menu, views
+shell = time.perf_counter() - start
+start = time.perf_counter()
+if sys.argv[1]:
+    importlib.import_module(sys.argv[1])
+page = time.perf_counter() - start
+heavy = [name for name in json.loads(sys.argv[2]) if name in sys.modules]
+print(json.dumps({"shell": shell, "page": page, "heavy": heavy}))
+"""
+
+
+def measure(module_name):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-c", MEASURE_SCRIPT, module_name, json.dumps(HEAVY_MODULES)],
+        capture_output=True, text=True, check=True, cwd=root,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    shell = measure("")
+    print(f"{'App shell (streamlit, pandas, option menu)':<45} {shell['shell'] * 1000:>8.0f} ms")
+    for title, _, module in PAGES:
+        timing = measure(f"views.{module}")
+        heavy = ", ".join(timing["heavy"]) or "none"
+        print(f"{title:<45} {timing['page'] * 1000:>8.0f} ms   heavy imports: {heavy}")
+
+
+if __name__ == "__main__":
+    main()
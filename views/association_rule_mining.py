@@ -0,0 +1,169 @@
+import uuid
+import streamlit as st
+import plotly.express as px
+from mining_jobs import MiningExecutor
+from views.shared import get_data, genre_tables, get_genre_colors, colorize_genre_string, render_html_table
+
+def explain_top_rule(rule):
+    explanation = (
+        f"### Spotlight on the Top Association Rule\n\n"
+        f"The top association rule is **{rule['antecedents_str']} → {rule['consequents_str']}** with a **support** of **{rule['support']:.4f}** (**{rule['support'] * 100:.2f}%** of movies), a **confidence** of **{rule['confidence']:.2f}**, and a **lift** of **{rule['lift']:.2f}**.\n\n"
+    )
+    if rule['lift'] > 1:
+        explanation += (
+            f"This means that movies in the **{rule['antecedents_str']}** genre are **{rule['lift']:.2f} times** more likely to be associated with the **{rule['consequents_str']}** genre than expected by random chance. "
+            f"The high lift value indicates a strong and meaningful relationship between these genres."
+        )
+    elif rule['lift'] == 1:
+        explanation += (
+            f"This indicates that there is no association between the **{rule['antecedents_str']}** and **{rule['consequents_str']}** genres beyond what would be expected by random chance."
+        )
+    else:
+        explanation += (
+            f"This suggests that the association between **{rule['antecedents_str']}** and **{rule['consequents_str']}** genres is weaker than random chance, indicating a possible inverse relationship."
+        )
+    return explanation
+
+
+def explain_scatter_plot(rules):
+    average_support = rules['support'].mean()
+    average_confidence = rules['confidence'].mean()
+    average_lift = rules['lift'].mean()
+    explanation = "### Understanding the Support vs. Confidence Scatter Plot\n\n"
+    explanation += (
+        f"The scatter plot visualizes the relationship between **support** and **confidence** for each association rule. On average, the rules have a **support** of **{average_support:.4f}** (**{average_support * 100:.2f}%** of movies) and a **confidence** of **{average_confidence:.2f}**. "
+        f"The size and color of the points represent the **lift** values, where larger and darker points indicate stronger associations.\n\n"
+    )
+    explanation += (
+        f"For instance, a rule with high support and high confidence implies that a large portion of movies contain both genres, and the presence of one genre reliably predicts the other. "
+        f"Conversely, rules with low support might represent niche genre pairings, while low confidence suggests that the association is less reliable."
+    )
+    return explanation
+
+def explain_association_table():
+    explanation = "### Dive Deeper with the Interactive Rules Table\n\n"
+    explanation += (
+        "The table above lists the top 50 association rules sorted by **lift**. Each row represents a rule where the **antecedent** genres (left side) predict the **consequents** genres (right side). "
+        "Here's what each metric means:\n\n"
+        "- **Support:** How frequently the genre combination appears in the dataset.\n"
+        "- **Confidence:** The likelihood that the consequent genre appears when the antecedent genre is present.\n"
+        "- **Lift:** The strength of the association compared to random chance.\n\n"
+        "By analyzing these metrics, you can identify which genres are commonly enjoyed together, enabling more effective recommendation strategies."
+    )
+    return explanation
+
+# Shared across all sessions so the concurrency cap applies per server
+@st.cache_resource
+def get_mining_executor():
+    return MiningExecutor()
+
+# Poll a running mining job without blocking the rest of the page
+@st.fragment(run_every=1.0)
+def show_mining_progress(job):
+    if job.done:
+        st.rerun()
+    st.progress(job.progress, text=job.message)
+
+
+def render():
+    movies, ratings, tags = get_data()
+    _, genres_onehot = genre_tables(movies)
+    genre_colors = get_genre_colors()
+
+    # Identify this browser session to the shared mining executor
+    if "session_id" not in st.session_state:
+        st.session_state["session_id"] = uuid.uuid4().hex
+
+    st.header("4. Association Rule Mining with Apriori")
+    
+    st.subheader("Preparing Data for Apriori")
+    st.write("Generating frequent itemsets based on movie genres.")
+    
+    st.write("Genres one-hot encoded.")
+    
+    st.subheader("Applying Apriori Algorithm")
+    st.write("Adjust the minimum support and confidence to generate association rules.")
+    
+    # Sliders for support and confidence
+    min_support = st.slider("Minimum Support", 0.001, 0.01, 0.005, 0.001, key='support_slider_assoc')
+    min_confidence = st.slider("Minimum Confidence", 0.1, 1.0, 0.3, 0.05, key='confidence_slider_assoc')
+    
+    # Mining runs on the shared background executor so slider changes do not block this session
+    executor = get_mining_executor()
+    job = executor.submit(st.session_state["session_id"], "genres", genres_onehot, min_support, min_confidence)
+    
+    if not job.done:
+        show_mining_progress(job)
+        st.info("Showing the previous results until the new run finishes.")
+    elif job.status == "failed":
+        st.error(f"Error generating association rules: {job.error}")
+        st.write("Please ensure that `mlxtend` is correctly installed and updated.")
+        # Failed runs are kept so the error stays visible; only rerun them on request
+        if st.button("Retry", key="retry_mining_assoc"):
+            executor.submit(st.session_state["session_id"], "genres", genres_onehot, min_support, min_confidence, retry=True)
+            st.rerun()
+    elif job.status == "finished":
+        frequent_itemsets = job.frequent_itemsets
+        st.write(f"**Number of frequent itemsets:** {frequent_itemsets.shape[0]:,}")
+        st.markdown(f"We have identified **{frequent_itemsets.shape[0]:,}** frequent genre combinations that appear in at least **{min_support * 100:.2f}%** of the sampled movies.")
+        
+        st.subheader("Generating Association Rules")
+        if job.rules is not None:
+            # Copy so per-session display columns never touch the shared result
+            rules = job.rules.copy()
+            
+            # Save rules to session state
+            st.session_state["rules"] = rules
+            st.write(f"**Number of association rules:** {rules.shape[0]:,}")
+        else:
+            st.warning("No frequent itemsets found. Try lowering the minimum support.")
+    
+    # Check if rules are not empty and visualize them
+    if "rules" in st.session_state and not st.session_state["rules"].empty:
+        rules = st.session_state["rules"]
+        
+        # Convert frozenset to string for easier visualization
+        rules['antecedents_str'] = rules['antecedents'].apply(lambda x: ', '.join(sorted(list(x))) if isinstance(x, frozenset) else x)
+        rules['consequents_str'] = rules['consequents'].apply(lambda x: ', '.join(sorted(list(x))) if isinstance(x, frozenset) else x)
+
+        # Apply colorization to antecedents and consequents
+        rules['antecedents_colored'] = rules['antecedents_str'].apply(lambda x: colorize_genre_string(x, genre_colors))
+        rules['consequents_colored'] = rules['consequents_str'].apply(lambda x: colorize_genre_string(x, genre_colors))
+
+        # Ensure antecedents_str and consequents_str are included in the selected columns
+        selected_columns = ['antecedents_str', 'consequents_str', 'antecedents_colored', 'consequents_colored', 'support', 'confidence', 'lift']
+        
+        st.markdown("### Top 10 Association Rules")
+        top_10_rules = rules[selected_columns].sort_values(by='lift', ascending=False).head(10)
+
+        # Render the top 10 rules as an HTML table with colored genres
+        render_html_table(top_10_rules[['antecedents_colored', 'consequents_colored', 'support', 'confidence', 'lift']])
+        
+        # Dynamic Explanation for Top 10 Rules
+        if not top_10_rules.empty:
+            # Pass the first rule row as a series
+            first_rule = top_10_rules.iloc[0]
+            st.markdown(explain_top_rule(first_rule))
+
+        
+        # Scatter plot of Support vs Confidence
+        st.markdown("### Support vs Confidence of Association Rules")
+        fig5 = px.scatter(rules, x='support', y='confidence', size='lift',
+                        color='lift', hover_data=['antecedents_colored', 'consequents_colored'],
+                        title='Support vs Confidence of Association Rules',
+                        labels={'support':'Support', 'confidence':'Confidence', 'lift':'Lift'},
+                        size_max=15)
+        st.plotly_chart(fig5, use_container_width=True)
+        
+        # Dynamic Explanation for Scatter Plot
+        st.markdown(explain_scatter_plot(rules))
+        
+        # Interactive Rules Table (HTML)
+        st.markdown("### Interactive Rules Table")
+        # Render the entire table as HTML
+        render_html_table(rules[['antecedents_colored', 'consequents_colored', 'support', 'confidence', 'lift']].sort_values(by='lift', ascending=False).head(50))
+        
+        # Dynamic Explanation for Interactive Table
+        st.markdown(explain_association_table())
+    else:
+        st.warning("No association rules to display.")
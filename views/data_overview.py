@@ -0,0 +1,25 @@
+import streamlit as st
+from views.shared import get_data
+
+
+def render():
+    movies, ratings, tags = get_data()
+
+    st.header("1. Data Overview")
+
+    st.subheader("Movies Dataset")
+    st.write(movies.head())
+    st.write(f"**Total Movies:** {movies.shape[0]:,}")
+    st.markdown(f"The Movies dataset contains **{movies.shape[0]:,}** entries. Each entry includes the movie's title and associated genres, providing a comprehensive view of the movie offerings.")
+    
+    st.subheader("Ratings Dataset (Sampled)")
+    st.write(ratings.head())
+    st.write(f"**Total Ratings (Sampled):** {ratings.shape[0]:,}")
+    st.markdown(f"The Ratings dataset comprises **{ratings.shape[0]:,}** sampled ratings from users. Each rating reflects how much a user liked a particular movie, ranging from 0.5 to 5.0 stars.")
+    
+    st.subheader("Tags Dataset (Sampled)")
+    st.write(tags.head())
+    st.write(f"**Total Tags (Sampled):** {tags.shape[0]:,}")
+    st.markdown(f"The Tags dataset includes **{tags.shape[0]:,}** sampled tags assigned by users to movies. These tags provide insights into user sentiments and descriptive keywords associated with movies.")
+
+    st.markdown("---")
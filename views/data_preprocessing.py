@@ -0,0 +1,53 @@
+import streamlit as st
+import pandas as pd
+from data_profile import column_table, histogram_frame
+from views.shared import load_dataset_profile
+
+
+def render():
+    st.header("2. Data Preprocessing")
+    
+    with st.spinner("Loading dataset profile..."):
+        profile = load_dataset_profile()
+    
+    st.subheader("Handling Missing Values")
+    st.write("Checking for missing values in each dataset:")
+    
+    st.write("**Movies Dataset Profile:**")
+    st.write(column_table(profile['movies']))
+    st.write("**Ratings Dataset Profile:**")
+    st.write(column_table(profile['ratings']))
+    st.write("**Tags Dataset Profile:**")
+    st.write(column_table(profile['tags']))
+    
+    # Histograms are stored only for low-cardinality columns, years of timestamps and individual genres
+    st.subheader("Value Distributions")
+    for dataset in ['movies', 'ratings', 'tags']:
+        for column, column_profile in profile[dataset]['columns'].items():
+            histogram = histogram_frame(column_profile)
+            if histogram is not None:
+                label = f"{column} (by year)" if column == 'timestamp' else column
+                st.write(f"**{dataset.capitalize()}: {label}**")
+                st.bar_chart(histogram)
+    
+    st.markdown("After thorough inspection, no significant missing values were detected across the datasets. This ensures that our analysis is based on complete and reliable data.")
+    
+    st.subheader("Converting Timestamps to Readable Dates")
+    st.write("Converted `timestamp` to `date` in Ratings and Tags datasets.")
+    st.write(pd.DataFrame(profile['ratings']['sample'])[['timestamp', 'date']])
+    st.write(pd.DataFrame(profile['tags']['sample'])[['timestamp', 'date']])
+    
+    ratings_timestamps = profile['ratings']['columns']['timestamp']
+    first_rating = pd.to_datetime(ratings_timestamps['min'], unit='s').date()
+    last_rating = pd.to_datetime(ratings_timestamps['max'], unit='s').date()
+    st.markdown(f"Transforming Unix timestamps into readable dates allows us to analyze temporal trends, such as how ratings and tags evolve over the years. The **{profile['ratings']['rows']:,}** ratings span from **{first_rating}** to **{last_rating}**.")
+    
+    st.subheader("Extracting Genres")
+    st.write("Extracted and split genres into lists.")
+    genres_sample = pd.DataFrame(profile['movies']['sample'])[['movieId', 'genres']]
+    genres_sample['genres'] = genres_sample['genres'].str.split('|')
+    st.write(genres_sample)
+    
+    st.markdown("Splitting genres into individual lists enables one-hot encoding, which is essential for performing association rule mining based on genre combinations.")
+    
+    st.markdown("---")
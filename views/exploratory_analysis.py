@@ -0,0 +1,138 @@
+import streamlit as st
+import plotly.express as px
+from views.shared import get_data, genre_tables
+
+def explain_top_movies(top_movies):
+    titles = top_movies['title'].tolist()
+    counts = top_movies['ratings_count'].tolist()
+    explanation = "### Insights on the Most Popular Movies\n"
+    explanation += "The bar chart below showcases the top 10 movies that have garnered the highest number of ratings. This popularity often reflects a movie's widespread appeal and cultural impact.\n\n"
+    
+    for i in range(min(3, len(titles))):
+        explanation += f"**{i+1}. {titles[i]}** has received **{counts[i]:,} ratings**. "
+        if i == 0:
+            explanation += "This top position highlights its immense popularity among viewers, possibly due to compelling storytelling, stellar performances, or significant cultural relevance. "
+        elif i == 1:
+            explanation += "Securing the second spot indicates strong viewer engagement and positive reception. "
+        elif i == 2:
+            explanation += "Being in the top three underscores its consistent appeal and likely critical acclaim. "
+    
+    explanation += "These leading movies set trends and influence viewer preferences, making them central to discussions within the film community."
+    return explanation
+
+def explain_ratings_distribution(ratings):
+    rating_counts = ratings['rating'].value_counts().sort_index()
+    most_common_rating = rating_counts.idxmax()
+    most_common_count = rating_counts.max()
+    explanation = "### Understanding the Ratings Distribution\n"
+    explanation += f"The histogram above reveals that **{most_common_rating} stars** is the most frequently assigned rating, received by **{most_common_count:,} users**. "
+    explanation += "This trend suggests that users generally hold movies in high regard, leaning towards favorable evaluations.\n\n"
+    explanation += "A skew towards higher ratings can indicate a positive user experience, while a balanced distribution would reflect a wider range of opinions."
+    return explanation
+
+def explain_ratings_over_time(ratings_per_year):
+    latest_year = ratings_per_year['year'].max()
+    latest_year_count = ratings_per_year.loc[ratings_per_year['year'] == latest_year, 'ratings_count'].values[0]
+    previous_year = latest_year - 1
+    explanation = "### Trends in Movie Ratings Over the Years\n"
+    
+    if previous_year in ratings_per_year['year'].values:
+        previous_year_count = ratings_per_year.loc[ratings_per_year['year'] == previous_year, 'ratings_count'].values[0]
+        change = latest_year_count - previous_year_count
+        if previous_year_count == 0:
+            percent_change = "N/A (no ratings in previous year)"
+            change_str = "infinite"
+        else:
+            percent_change = (change / previous_year_count) * 100
+            change_str = f"{percent_change:+.2f}%"
+        explanation += f"In **{latest_year}**, there were **{latest_year_count:,} ratings**, which is a **{change_str}** change compared to **{previous_year}** with **{previous_year_count:,} ratings**. "
+        
+        if percent_change == "N/A (no ratings in previous year)":
+            explanation += "This indicates that there were no ratings in the previous year to compare with."
+        else:
+            if percent_change > 0:
+                explanation += "This increase suggests that more users are engaging with rating movies, possibly due to an expanding user base or increased platform activity."
+            elif percent_change < 0:
+                explanation += "This decrease could point to a decline in user engagement or a shift in user behavior over the years."
+            else:
+                explanation += "This stable trend shows that user engagement with movie ratings has remained consistent over the years."
+    else:
+        explanation += f"In **{latest_year}**, there were **{latest_year_count:,} ratings**. There is no data available for the previous year to assess changes in user engagement."
+    
+    explanation += "\n\nMonitoring these trends helps platforms understand user engagement levels and adjust their strategies accordingly to maintain or boost interaction."
+    return explanation
+
+def explain_genre_distribution(genre_counts):
+    if genre_counts.shape[0] >= 2:
+        top_genre = genre_counts.iloc[0]
+        second_genre = genre_counts.iloc[1]
+        explanation = "### Distribution of Movie Genres\n"
+        explanation += f"The pie chart above illustrates that **{top_genre['genre']}** is the most prevalent genre with **{top_genre['count']:,}** movies, followed by **{second_genre['genre']}** with **{second_genre['count']:,}** movies. "
+        explanation += "This dominance indicates viewer preferences and can guide content creation and acquisition strategies to align with popular genres."
+    elif genre_counts.shape[0] == 1:
+        top_genre = genre_counts.iloc[0]
+        explanation = "### Distribution of Movie Genres\n"
+        explanation += f"The pie chart above shows that **{top_genre['genre']}** is the sole genre present with **{top_genre['count']:,}** movies. "
+        explanation += "A diverse genre distribution is essential for catering to varied viewer tastes."
+    else:
+        explanation = "### Distribution of Movie Genres\n"
+        explanation += "The pie chart does not display any genre distribution as the dataset contains no genres."
+    return explanation
+
+
+def render():
+    movies, ratings, tags = get_data()
+    genre_counts, _ = genre_tables(movies)
+
+    st.header("3. Exploratory Data Analysis")
+    
+    # Filter ratings for years 2005 to 2015
+    ratings['year'] = ratings['date'].dt.year
+    filtered_ratings = ratings[(ratings['year'] >= 2005) & (ratings['year'] <= 2015)]
+    
+    st.subheader("Top 10 Most Rated Movies")
+    top_movies = filtered_ratings['movieId'].value_counts().head(10).reset_index()
+    top_movies.columns = ['movieId', 'ratings_count']
+    top_movies = top_movies.merge(movies, on='movieId')
+    fig1 = px.bar(top_movies, x='title', y='ratings_count', 
+                  title='Top 10 Most Rated Movies (2005-2015)',
+                  labels={'title':'Movie Title', 'ratings_count':'Number of Ratings'},
+                  hover_data={'title': True, 'ratings_count': True})
+    st.plotly_chart(fig1, use_container_width=True)
+    
+    # Dynamic Explanation for Top 10 Movies
+    st.markdown(explain_top_movies(top_movies))
+    
+    st.subheader("Distribution of Ratings")
+    fig2 = px.histogram(filtered_ratings, x='rating', nbins=10, 
+                       title='Distribution of Ratings (2005-2015)',
+                       labels={'rating':'Rating'},
+                       opacity=0.75)
+    st.plotly_chart(fig2, use_container_width=True)
+    
+    # Dynamic Explanation for Ratings Distribution
+    st.markdown(explain_ratings_distribution(filtered_ratings))
+    
+    st.subheader("Ratings Over Time")
+    ratings_per_year = filtered_ratings.groupby('year').size().reset_index(name='ratings_count')
+    fig3 = px.line(ratings_per_year, x='year', y='ratings_count', 
+                   title='Number of Ratings Over Years (2005-2015)',
+                   labels={'year':'Year', 'ratings_count':'Number of Ratings'},
+                   markers=True)
+    st.plotly_chart(fig3, use_container_width=True)
+    
+    # Dynamic Explanation for Ratings Over Time
+    st.markdown(explain_ratings_over_time(ratings_per_year))
+    
+    st.subheader("Genre Distribution")
+    fig4 = px.pie(genre_counts, names='genre', values='count', 
+                 title='Genre Distribution (2005-2015)',
+                 hover_data=['count'],
+                 labels={'count':'Number of Movies'},
+                 hole=0.3)
+    st.plotly_chart(fig4, use_container_width=True)
+    
+    # Dynamic Explanation for Genre Distribution
+    st.markdown(explain_genre_distribution(genre_counts))
+    
+    st.markdown("---")
@@ -0,0 +1,164 @@
+import streamlit as st
+import plotly.express as px
+from views.shared import get_data, genre_tables, get_genre_colors, colorize_genre_string
+
+def extract_unique_genres(top_associations):
+    """
+    Extracts unique genres from the top_associations DataFrame,
+    ensuring each genre appears only once with its highest lift value.
+    """
+    print("Extracting unique genres with highest lift values.")
+    
+    # Initialize a dictionary to hold the highest lift per genre
+    genre_lift_dict = {}
+    
+    for _, row in top_associations.iterrows():
+        # Split the consequents_str into individual genres
+        genres = [genre.strip() for genre in row['consequents_str'].split(',')]
+        for genre in genres:
+            # Update the lift value if it's higher than the existing one
+            if genre not in genre_lift_dict or row['lift'] > genre_lift_dict[genre]:
+                genre_lift_dict[genre] = row['lift']
+                print(f"Updated lift for genre '{genre}': {row['lift']:.2f}")
+    
+    # Convert the dictionary to a sorted list of tuples (genre, lift)
+    sorted_genres = sorted(genre_lift_dict.items(), key=lambda x: x[1], reverse=True)
+    print(f"Unique genres sorted by lift: {sorted_genres}")
+    
+    return sorted_genres
+
+def explain_recommendations(selected_genre, top_associations, genre_colors):
+    if not top_associations.empty:
+        print("Step 2: Getting unique associations and their highest lift values.")
+        
+        # Step 2: Extract unique genres with highest lift values
+        unique_genres = extract_unique_genres(top_associations)
+        
+        # Step 3: Format the unique genres with lift values and HTML colors
+        print("Step 3: Formatting the unique genres with lift values.")
+        associations_list = [
+            f"<strong><span style=\"color:{genre_colors.get(genre, '#000000')};\">{genre}</span></strong> (lift: {lift:.2f})"
+            for genre, lift in unique_genres
+        ]
+        print(f"Formatted associations list with lift values: {associations_list}")
+        
+        # Combine the associations into a single paragraph
+        print("Step 4: Combining the associations into a single paragraph.")
+        if len(associations_list) > 1:
+            associations_paragraph = ', '.join(associations_list[:-1]) + f", and {associations_list[-1]}."
+        else:
+            associations_paragraph = associations_list[0]
+        print(f"Final associations paragraph: {associations_paragraph}")
+        
+        # Start the explanation text
+        print("Step 5: Creating the explanation text.")
+        explanation = f"### In-Depth Look at Recommendations for **{colorize_genre_string(selected_genre, genre_colors)}**\n\n"
+        explanation += (
+            f"The bar chart above highlights the top genres associated with **{colorize_genre_string(selected_genre, genre_colors)}**. "
+            f"Each bar represents an associated genre and its **lift** value, which indicates the strength of the association. "
+            f"These associations include {associations_paragraph} "
+            f"Users who enjoy **{colorize_genre_string(selected_genre, genre_colors)}** movies often find these genres appealing, "
+            f"enhancing their viewing experience with complementary content."
+        )
+        
+        # Consolidate Practical Applications, Solving Challenges, and Empowering Decisions into one paragraph
+        print("Step 6: Adding practical applications to the explanation text.")
+        recommendation_genres = [genre for genre, _ in unique_genres]
+        recommendation_genres_colored = [colorize_genre_string(genre, genre_colors) for genre in recommendation_genres]
+        recommendation_genres_str = ', '.join(recommendation_genres_colored)
+        
+        explanation += "\n\n"
+        explanation += (
+            "Movie streaming platforms and theaters often struggle to recommend content that truly resonates with users. "
+            "By leveraging **Association Rule Mining**, genre associations can be identified to improve recommendations. "
+            f"For instance, streaming services can refine their algorithms by suggesting complementary genres like **{recommendation_genres_str}** to users who enjoy **{colorize_genre_string(selected_genre, genre_colors)}**, increasing user satisfaction. "
+            f"Similarly, theaters can curate more appealing lineups by pairing genres such as **{colorize_genre_string(selected_genre, genre_colors)}** with **{recommendation_genres_str}**, attracting a wider audience. "
+            "These data-driven strategies personalize recommendations, foster greater engagement, and promote platform loyalty, ensuring that both businesses and users benefit from a more tailored movie experience."
+        )
+        
+        print("Step 7: Final explanation generated.")
+        return explanation
+    else:
+        print("No strong associations found for the selected genre.")
+        return "No strong associations found for the selected genre."
+
+
+def render():
+    movies, ratings, tags = get_data()
+    genre_counts, _ = genre_tables(movies)
+    genre_colors = get_genre_colors()
+
+    st.header("5. Movie Recommendations Based on Association Rules")
+    
+    # Introduce a Narrative
+    st.markdown(""" ### Empowering Movie Recommendations with Data-Driven Insights
+    Movie streaming platforms and theaters face a common challenge: recommending films that truly resonate with users, thereby increasing engagement and satisfaction. With a vast array of movies available, it can be difficult to consistently suggest content that users will enjoy. This is where **Association Rule Mining** comes in.
+    By analyzing patterns in genre preferences, we can uncover which genres tend to be enjoyed together. This analysis provides actionable insights that benefit various stakeholders: """)
+    
+    # Check if the rules exist in the session state
+    if "rules" in st.session_state and not st.session_state["rules"].empty:
+        rules = st.session_state["rules"]  # Access the rules from session state
+        
+        st.markdown("### Select a Genre for Recommendations")
+        selected_genre = st.selectbox("Choose a Genre", sorted(genre_counts['genre'].unique()))
+        
+        st.markdown("### Top Associated Genres")
+        
+        # Convert 'antecedents_str' back to sets for accurate filtering
+        rules['antecedents_set'] = rules['antecedents_str'].apply(lambda x: set(x.split(", ")) if isinstance(x, str) else x)
+        
+        # Filter based on the selected genre
+        filtered_rules = rules[rules['antecedents_set'].apply(lambda x: selected_genre in x)]
+        
+        if not filtered_rules.empty:
+            top_associations = filtered_rules.sort_values(by='lift', ascending=False).head(10)
+            
+            # Extract and display unique associated genres
+            unique_associations = top_associations['consequents_str'].str.split(", ").explode().drop_duplicates()
+            
+            # Colorize the associated genres and create a paragraph
+            association_paragraph = ', '.join([colorize_genre_string(genre, genre_colors) for genre in unique_associations.sort_values()])
+            
+            # Render the paragraph with colored genres
+            st.markdown(f"### Users who like **{colorize_genre_string(selected_genre, genre_colors)}** also like: {association_paragraph}.", unsafe_allow_html=True)
+            
+            # Combine all practical applications, solving challenges, and empowering decisions into one paragraph
+            st.markdown(
+                f"""
+                To address the common challenges faced by movie streaming platforms and theaters in recommending content that truly resonates with users, leveraging **Association Rule Mining** can enhance recommendations by identifying genre associations. For movie streaming services, these insights can refine algorithms by suggesting complementary genres like **{', '.join([colorize_genre_string(genre, genre_colors) for genre in unique_associations])}** to users who enjoy **{colorize_genre_string(selected_genre, genre_colors)}**, boosting satisfaction and engagement. Similarly, movie theaters can curate diverse lineups by pairing genres such as **{colorize_genre_string(selected_genre, genre_colors)}** and **{', '.join([colorize_genre_string(genre, genre_colors) for genre in unique_associations])}**, attracting a wider audience. Individual users also benefit from discovering new genres—such as **{', '.join([colorize_genre_string(genre, genre_colors) for genre in unique_associations])}**—that align with their tastes, enriching their personal movie libraries. These data-driven strategies not only personalize recommendations but also empower stakeholders to foster greater engagement, loyalty, and platform usage, ensuring that both businesses and users enjoy a more tailored and satisfying movie experience.
+                """, unsafe_allow_html=True
+            )
+            
+            st.markdown("### Visualization of Associations")
+            # Create a bar chart with associated genres and their lift values
+            fig6 = px.bar(top_associations, 
+                         x='consequents_str', 
+                         y='lift',
+                         hover_data=['support', 'confidence'],
+                         title=f'Top Associated Genres with {selected_genre}',
+                         labels={'lift':'Lift', 'consequents_str':'Associated Genre'},
+                         text='lift')
+            fig6.update_traces(texttemplate='%{text:.2f}', textposition='outside')
+            fig6.update_layout(uniformtext_minsize=8, uniformtext_mode='hide')
+            
+            # Update the colors of the bars
+            fig6.update_traces(marker_color=[genre_colors.get(genre, "#000000") for genre in top_associations['consequents_str']])
+            
+            st.plotly_chart(fig6, use_container_width=True)
+            
+            # Dynamic Explanation for Recommendations Bar Chart
+            st.markdown(explain_recommendations(selected_genre, top_associations, genre_colors), unsafe_allow_html=True)
+        else:
+            st.markdown(f"No association rules found for the selected genre: **{selected_genre}**.")
+    else:
+        st.warning("Association rules have not been generated yet. Please go to the 'Association Rule Mining' section first.")
+    
+    st.markdown("---")
+    
+    # Concluding the Journey
+    st.markdown("### Concluding Our Journey")
+    st.markdown(
+        """
+        Through meticulous analysis and data-driven methodologies, we've uncovered meaningful associations within the MovieLens 20M dataset. These insights not only enhance movie recommendation systems but also provide strategic guidance for stakeholders aiming to elevate user satisfaction and engagement.
+        """, unsafe_allow_html=True
+    )
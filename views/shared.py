@@ -0,0 +1,97 @@
+import streamlit as st
+import pandas as pd
+from data_profile import load_profile
+
+# --------------------------
+# Shared Data and Helpers
+# --------------------------
+
+# Load Data Function
+@st.cache_data
+def load_data():
+    """
+    Load the complete MovieLens 20M dataset.
+    """
+    # Adjust the path as necessary
+    movies = pd.read_csv('ml-20m/movies.csv')
+    ratings = pd.read_csv('ml-20m/ratings.csv')
+    tags = pd.read_csv('ml-20m/tags.csv')
+
+    # Build the profile sidecar at ingestion from the frames just read, if it is missing or stale
+    load_profile('ml-20m', frames={'movies': movies, 'ratings': ratings, 'tags': tags})
+
+    return movies, ratings, tags
+
+# Preprocess Data Function
+@st.cache_data
+def preprocess_data(movies, ratings, tags):
+    # Converting Timestamps to Readable Dates
+    ratings['date'] = pd.to_datetime(ratings['timestamp'], unit='s')
+    tags['date'] = pd.to_datetime(tags['timestamp'], unit='s')
+
+    # Extracting Genres
+    movies['genres'] = movies['genres'].str.split('|')
+
+    return movies, ratings, tags
+
+def get_data():
+    """
+    Load and preprocess the datasets, only on pages that need them.
+    """
+    with st.spinner("Loading data..."):
+        movies, ratings, tags = load_data()
+    return preprocess_data(movies, ratings, tags)
+
+# Dataset profile sidecar, built once at ingestion and reused by every session
+@st.cache_data
+def load_dataset_profile():
+    return load_profile('ml-20m')
+
+def genre_tables(movies):
+    """
+    Genre counts and the one-hot movie x genre matrix.
+    """
+    # Explode genres
+    genres_exploded = movies.explode('genres')
+    genre_counts = genres_exploded['genres'].value_counts().reset_index()
+    genre_counts.columns = ['genre', 'count']
+
+    # One-hot encode genres
+    genres_onehot = genres_exploded.pivot_table(index='movieId', columns='genres', aggfunc='size', fill_value=0)
+    return genre_counts, genres_onehot
+
+# Generate a color mapping for each genre
+def generate_genre_colors(genres):
+    # seaborn is only needed for the palette, so keep it off the startup path
+    import seaborn as sns
+
+    genre_colors = {}
+    # Use seaborn's color palette to generate distinct colors
+    color_palette = sns.color_palette("Set3", len(genres))
+
+    # Map each genre to a unique color from the palette
+    for i, genre in enumerate(genres):
+        genre_colors[genre] = f'#{int(color_palette[i][0] * 255):02x}{int(color_palette[i][1] * 255):02x}{int(color_palette[i][2] * 255):02x}'  # RGB to Hex
+
+    return genre_colors
+
+@st.cache_data
+def get_genre_colors():
+    # Load movies.csv file and extract the unique individual genres
+    movies_df = pd.read_csv("ml-20m/movies.csv")
+    unique_genres = movies_df['genres'].str.split('|').explode().unique().tolist()
+    return generate_genre_colors(unique_genres)
+
+# Function to colorize genre strings dynamically
+def colorize_genre_string(genre_string, genre_colors):
+    genres = genre_string.split(', ')
+    colored_genres = []
+    for genre in genres:
+        genre_color = genre_colors.get(genre, "#000000")  # Default to black if no color is found
+        colored_genres.append(f'<span style="color:{genre_color};">{genre}</span>')
+    return ', '.join(colored_genres)
+
+# Function to render the HTML table with genre colors
+def render_html_table(df):
+    html = df.to_html(escape=False)  # Escape=False allows raw HTML in the table
+    st.markdown(html, unsafe_allow_html=True)
@@ -0,0 +1,99 @@
+import streamlit as st
+from streamlit_lottie import st_lottie
+import requests
+
+# Load Lottie Animations
+WELCOME_ANIMATION_URL = "https://assets10.lottiefiles.com/packages/lf20_jcikwtux.json"  # Celebration animation
+
+# Cached so the animation is fetched once instead of on every rerun; failures
+# raise so they are never cached and the next visit tries again
+@st.cache_data
+def fetch_lottie(url: str):
+    r = requests.get(url)
+    r.raise_for_status()
+    return r.json()
+
+def load_lottieurl(url: str):
+    """
+    Load a Lottie animation from a URL.
+    """
+    try:
+        return fetch_lottie(url)
+    except:
+        return None
+
+
+def render():
+    lottie_welcome = load_lottieurl(WELCOME_ANIMATION_URL)
+
+    # Welcome Page with Animation
+    st.markdown(
+        """
+        <h1 style='text-align: center; font-size: 60px;'>Welcome to MovieLens 20M Analysis</h1>
+        """,
+        unsafe_allow_html=True,
+    )
+
+    # Lottie Animation (if available)
+    if lottie_welcome:
+        st_lottie(lottie_welcome, height=300, key="welcome")
+    else:
+        st.error("Failed to load the welcome animation.")
+
+    st.markdown(
+        """
+        **Empowering Movie Recommendations with Data-Driven Insights**  
+        Movie streaming platforms and theaters face a common challenge: recommending films that truly resonate with users, thereby increasing engagement and satisfaction. With a vast array of movies available, it can be difficult to consistently suggest content that users will enjoy. This is where **Association Rule Mining** comes in, by analyzing patterns in genre preferences, we can uncover which genres tend to be enjoyed together, providing actionable insights for better recommendations.
+
+        ### Problem at Hand:  
+        Movie recommendations are often generic or uninspiring. Users are bombarded with options but struggle to find films that match their taste. Streaming platforms and theaters also face the challenge of presenting engaging content. Our goal is to solve this problem using **data-driven insights** to improve movie recommendations.
+
+        ### Our Solution:  
+        By analyzing movie data from **2005 to 2015**, we can tailor movie recommendations that suit different genres, increase user satisfaction, and even expand content diversity. This app allows you to explore recommendations based on genres and movie preferences, helping both users and businesses discover new, exciting movie experiences.
+
+        ### What You Can Explore:
+        - **Genre Distributions**: Dive into how different genres are distributed across the dataset.
+        - **Ratings Analysis**: Analyze how movies have been rated over the years.
+        - **Movie Recommendations**: Explore personalized movie suggestions based on genre associations.
+
+        **Let’s begin this exciting journey of movie discovery!**
+        """
+    )
+
+    # New section: Meet Our Team
+    st.markdown("## Meet Our Team")
+    st.markdown(
+        """
+        We are **Group Nime**, a dedicated team passionate about uncovering insights from the MovieLens 20M dataset. Our collective skills and diverse perspectives drive this interactive data journey. Below are our team members:
+        """
+    )
+
+    # Team member cards (without images)
+    team_members = [
+        {"name": "Mark Kenneth Badilla", "role": "Leader", "years": "SY 2020-2023"},
+        {"name": "Rob Borinaga", "role": "Member", "years": "SY 2019-2023"},
+        {"name": "Alestair Cyril Coyoca", "role": "Member", "years": "SY 2021-2024"},
+        {"name": "Carmelyn Nime Gerali", "role": "Member", "years": "SY 2018-2022"},
+        {"name": "James Alein Ocampo", "role": "Member", "years": "SY 2020-2024"}
+    ]
+
+    # Create two rows: one for the top 3 cards, another for the bottom 2 cards
+    top_row = st.columns(3)
+    bottom_row = st.columns([1, 1, 1])
+
+    for i, member in enumerate(team_members):
+        if i < 3:
+            column = top_row[i]
+        else:
+            column = bottom_row[i - 3]
+        
+        with column:
+            st.markdown(
+            f"""
+            <div style="background-color: #1c1d24; border-radius: 10px; padding: 15px; margin-bottom: 10px; text-align: center; max-width: 380px;">
+                <h3 style="margin: 0; color: #FFFFFF; padding: 0;">{member['name']}</h3>
+                <p style="margin: 5px 0; color: #4CAF50;">{member['role']}</p>
+            </div>
+            """,
+            unsafe_allow_html=True
+        )